@@ -1,36 +1,139 @@
 import os
 import logging
-from flask import Flask, render_template, request, send_file, flash, redirect, url_for, jsonify
-from werkzeug.utils import secure_filename
+from flask import Flask, Request, render_template, request, send_file, flash, redirect, url_for, jsonify, g
 from werkzeug.exceptions import RequestEntityTooLarge
+import io
+import re
+import gzip
+import time
+import unicodedata
+import hashlib
 import tempfile
 import shutil
-from converters import (PDFToPNGConverter, PNGToJPGConverter, MP4ToMP3Converter, 
-                      DOCXToPDFConverter, DOCToPDFConverter, TXTToPDFConverter,
-                      EPUBToPDFConverter, JPGToPDFConverter, PDFToDOCXConverter,
-                      XLSXToPDFConverter, PPTXToPDFConverter, PDFToTXTConverter,
-                      XLSXToCSVConverter, CSVToXLSXConverter, CSVToPDFConverter,
-                      HTMLToPDFConverter, PDFToHTMLConverter, MP3ToWAVConverter,
-                      WAVToMP3Converter, MP4ToAVIConverter, AVIToMP4Converter,
-                      WEBPToJPGConverter, BMPToPNGConverter, CompressPDFConverter,
-                      JPGToWEBPConverter, JPGToPNGConverter, MKVToMP4Converter,
-                      MP4ToWEBMConverter, OGGToMP3Converter, MergePDFsConverter,
-                      MergeImagesConverter)
-
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+import threading
+import importlib
+from functools import lru_cache
+
+# Configure logging; set LOG_LEVEL=DEBUG when troubleshooting
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+# Optional background task queue; conversions run in-process without it
+celery = None
+if os.environ.get('REDIS_URL'):
+    try:
+        from tasks import celery, run_conversion
+    except ImportError:
+        logging.warning("REDIS_URL is set but Celery is not installed; running conversions in-process")
+
+class StreamRequest(Request):
+    """Request that streams file uploads straight into the conversion's temp directory"""
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        temp_dir = g.get('temp_dir')
+        if temp_dir is None:
+            return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+        return HashingFile(new_upload_path(temp_dir, filename))
+
+class HashingFile(io.BufferedRandom):
+    """Upload file on disk that hashes its content as it is written"""
+    
+    def __init__(self, path):
+        super().__init__(io.FileIO(path, 'w+'))
+        self.digest = hashlib.blake2b(digest_size=16)
+    
+    def write(self, data):
+        self.digest.update(data)
+        return super().write(data)
+
+def new_upload_path(temp_dir, filename):
+    """Reserve a path for the next upload in the conversion's temp directory"""
+    # One sub-directory per upload keeps duplicate names apart and the
+    # original file name intact for the converter's output name
+    g.upload_count = g.get('upload_count', 0) + 1
+    upload_dir = os.path.join(temp_dir, f"upload_{g.upload_count:02d}")
+    os.makedirs(upload_dir)
+    return os.path.join(upload_dir, safe_filename(filename or '') or 'upload')
+
+# Anything but these is replaced when naming uploads on disk
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9_.-]+')
+MAX_FILENAME_LENGTH = 128
+
+def safe_filename(filename):
+    """ASCII-only file name safe to join to a directory, in one precompiled regex pass"""
+    filename = unicodedata.normalize('NFKD', filename).encode('ascii', 'ignore').decode('ascii')
+    # Path separators become '_', and stripping '.'/'_' rules out '..' and hidden files
+    filename = _UNSAFE_FILENAME_CHARS.sub('_', filename).strip('._')
+    
+    # Shorten the stem rather than cutting off the extension
+    if len(filename) > MAX_FILENAME_LENGTH:
+        stem, ext = os.path.splitext(filename)
+        filename = stem[:MAX_FILENAME_LENGTH - len(ext)] + ext
+    return filename
 
 app = Flask(__name__)
+app.request_class = StreamRequest
 app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key-change-in-production")
 
 # Configuration
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max file size
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['CONVERTED_FOLDER'] = 'converted'
+app.config['CACHE_FOLDER'] = os.path.abspath(os.environ.get('CACHE_FOLDER', 'cache'))
+app.config['CACHE_MAX_BYTES'] = int(os.environ.get('CACHE_MAX_BYTES', 1024 * 1024 * 1024))  # 1GB
+# RAM-backed tmpfs by default; Celery workers on other hosts can't see this
+# host's tmpfs, so with REDIS_URL set it must name a shared directory
+app.config['TEMP_FOLDER'] = os.environ.get(
+    'TEMP_FOLDER', None if os.environ.get('REDIS_URL') else '/dev/shm/converter'
+)
+app.config['MAX_TEMP_FILE_SIZE'] = int(os.environ.get('MAX_TEMP_FILE_SIZE', 1024 * 1024 * 1024))  # 1GB
 
 # Ensure upload and converted directories exist
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 os.makedirs(app.config['CONVERTED_FOLDER'], exist_ok=True)
+os.makedirs(app.config['CACHE_FOLDER'], exist_ok=True)
+
+def configure_temp_folder():
+    """Put conversion temp directories on tmpfs when it has room, else keep the OS default"""
+    temp_folder = app.config['TEMP_FOLDER']
+    if temp_folder is None:
+        logging.warning(
+            "REDIS_URL is set without TEMP_FOLDER; uploads go to %s, which workers "
+            "on other hosts can't read", tempfile.gettempdir()
+        )
+        return
+    try:
+        os.makedirs(temp_folder, exist_ok=True)
+        stat = os.statvfs(temp_folder)
+    except (OSError, AttributeError):
+        return
+    
+    # Room for at least two maximum-size uploads plus their outputs
+    if stat.f_bavail * stat.f_frsize < 2 * app.config['MAX_CONTENT_LENGTH']:
+        logging.info("Not enough free space in %s, using %s", temp_folder, tempfile.gettempdir())
+        return
+    tempfile.tempdir = temp_folder
+    
+    # Files on tmpfs live in RAM, so cap how large any single written file
+    # (including FFmpeg output from child processes) can grow
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_FSIZE)
+        limit = app.config['MAX_TEMP_FILE_SIZE']
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        if soft == resource.RLIM_INFINITY or soft > limit:
+            resource.setrlimit(resource.RLIMIT_FSIZE, (limit, hard))
+    except (ImportError, ValueError, OSError) as e:
+        logging.warning("Failed to limit temp file size: %s", e)
+
+configure_temp_folder()
+
+# Cached outputs are stored as <cache key>/output<suffix>, e.g. output_compressed.pdf
+CACHE_ENTRY_NAME = 'output'
+CACHE_EVICTION_INTERVAL = 60  # seconds
+_last_cache_eviction = 0
+CACHE_KEY_PATTERN = re.compile(r'[a-z0-9_]+_[0-9a-f]{32}')
+CACHE_MAX_AGE = 3600  # seconds, for /download responses
 
 # Allowed file extensions for each conversion type
 ALLOWED_EXTENSIONS = {
@@ -78,61 +181,259 @@ ALLOWED_EXTENSIONS = {
     'merge_images': {'jpg', 'jpeg', 'png', 'webp', 'bmp'}
 }
 
-# Initialize converters
-converters = {
+# Flattened (conversion_type, extension) pairs for a single lookup per check
+ALLOWED_PAIRS = frozenset(
+    (conversion_type, extension)
+    for conversion_type, extensions in ALLOWED_EXTENSIONS.items()
+    for extension in extensions
+)
+
+# Leading bytes expected for each extension, as alternatives of (offset, bytes)
+# checks that must all match. Text formats (txt, csv, html) have no signature.
+# ZIP containers (docx, xlsx, pptx, epub) only get the PK check here, deeper
+# validation is left to the converter.
+ZIP_SIGNATURE = ((0, b'PK\x03\x04'),)
+OLE_SIGNATURE = ((0, b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'),)
+MAGIC_SIGNATURES = {
+    'pdf': (((0, b'%PDF-'),),),
+    'docx': (ZIP_SIGNATURE,),
+    'xlsx': (ZIP_SIGNATURE,),
+    'pptx': (ZIP_SIGNATURE,),
+    'epub': (ZIP_SIGNATURE,),
+    'doc': (OLE_SIGNATURE, ((0, b'{\\rtf'),), ZIP_SIGNATURE),
+    'xls': (OLE_SIGNATURE, ZIP_SIGNATURE),
+    'jpg': (((0, b'\xff\xd8\xff'),),),
+    'jpeg': (((0, b'\xff\xd8\xff'),),),
+    'png': (((0, b'\x89PNG\r\n\x1a\n'),),),
+    'webp': (((0, b'RIFF'), (8, b'WEBP')),),
+    'bmp': (((0, b'BM'),),),
+    # Untagged MP3s start with a frame header, checked by mpeg_frame_sync
+    'mp3': (((0, b'ID3'),),),
+    'wav': (((0, b'RIFF'), (8, b'WAVE')),),
+    'ogg': (((0, b'OggS'),),),
+    'mp4': (((4, b'ftyp'),),),
+    'avi': (((0, b'RIFF'), (8, b'AVI ')),),
+    'mkv': (((0, b'\x1a\x45\xdf\xa3'),),),
+}
+MAGIC_HEADER_SIZE = 16
+
+# Converter class for each conversion type, instantiated on first use by
+# get_converter so workers only import the libraries they actually need
+CONVERTER_CLASSES = {
     # Document conversions
-    'pdf_to_docx': PDFToDOCXConverter(),
-    'docx_to_pdf': DOCXToPDFConverter(),
-    'doc_to_pdf': DOCToPDFConverter(),
-    'pptx_to_pdf': PPTXToPDFConverter(),
-    'pdf_to_txt': PDFToTXTConverter(),
-    'txt_to_pdf': TXTToPDFConverter(),
-    'xlsx_to_csv': XLSXToCSVConverter(),
-    'csv_to_xlsx': CSVToXLSXConverter(),
-    'xlsx_to_pdf': XLSXToPDFConverter(),
-    'csv_to_pdf': CSVToPDFConverter(),
-    'html_to_pdf': HTMLToPDFConverter(),
-    'epub_to_pdf': EPUBToPDFConverter(),
-    'pdf_to_html': PDFToHTMLConverter(),
+    'pdf_to_docx': 'PDFToDOCXConverter',
+    'docx_to_pdf': 'DOCXToPDFConverter',
+    'doc_to_pdf': 'DOCToPDFConverter',
+    'pptx_to_pdf': 'PPTXToPDFConverter',
+    'pdf_to_txt': 'PDFToTXTConverter',
+    'txt_to_pdf': 'TXTToPDFConverter',
+    'xlsx_to_csv': 'XLSXToCSVConverter',
+    'csv_to_xlsx': 'CSVToXLSXConverter',
+    'xlsx_to_pdf': 'XLSXToPDFConverter',
+    'csv_to_pdf': 'CSVToPDFConverter',
+    'html_to_pdf': 'HTMLToPDFConverter',
+    'epub_to_pdf': 'EPUBToPDFConverter',
+    'pdf_to_html': 'PDFToHTMLConverter',
     
     # Image conversions
-    'jpg_to_png': JPGToPNGConverter(),
-    'png_to_jpg': PNGToJPGConverter(),
-    'webp_to_jpg': WEBPToJPGConverter(),
-    'jpg_to_webp': JPGToWEBPConverter(),
-    'image_to_pdf': JPGToPDFConverter(),
-    'pdf_to_png': PDFToPNGConverter(),
-    'bmp_to_png': BMPToPNGConverter(),
+    'jpg_to_png': 'JPGToPNGConverter',
+    'png_to_jpg': 'PNGToJPGConverter',
+    'webp_to_jpg': 'WEBPToJPGConverter',
+    'jpg_to_webp': 'JPGToWEBPConverter',
+    'image_to_pdf': 'JPGToPDFConverter',
+    'pdf_to_png': 'PDFToPNGConverter',
+    'bmp_to_png': 'BMPToPNGConverter',
     
     # Audio conversions
-    'mp3_to_wav': MP3ToWAVConverter(),
-    'wav_to_mp3': WAVToMP3Converter(),
-    'mp4_to_mp3': MP4ToMP3Converter(),
-    'ogg_to_mp3': OGGToMP3Converter(),
+    'mp3_to_wav': 'MP3ToWAVConverter',
+    'wav_to_mp3': 'WAVToMP3Converter',
+    'mp4_to_mp3': 'MP4ToMP3Converter',
+    'ogg_to_mp3': 'OGGToMP3Converter',
     
     # Video conversions
-    'mp4_to_avi': MP4ToAVIConverter(),
-    'avi_to_mp4': AVIToMP4Converter(),
-    'mkv_to_mp4': MKVToMP4Converter(),
-    'mp4_to_webm': MP4ToWEBMConverter(),
+    'mp4_to_avi': 'MP4ToAVIConverter',
+    'avi_to_mp4': 'AVIToMP4Converter',
+    'mkv_to_mp4': 'MKVToMP4Converter',
+    'mp4_to_webm': 'MP4ToWEBMConverter',
     
     # Extras
-    'compress_pdf': CompressPDFConverter(),
-    'merge_pdfs': MergePDFsConverter(),
-    'merge_images': MergeImagesConverter()
+    'compress_pdf': 'CompressPDFConverter',
+    'merge_pdfs': 'MergePDFsConverter',
+    'merge_images': 'MergeImagesConverter'
 }
 
+@lru_cache(maxsize=None)
+def get_converter(conversion_type):
+    """Return the shared converter instance for a conversion type"""
+    module = importlib.import_module('converters')
+    return getattr(module, CONVERTER_CLASSES[conversion_type])()
+
 def allowed_file(filename, conversion_type):
     """Check if file extension is allowed for the conversion type"""
-    if '.' not in filename:
-        return False
-    extension = filename.rsplit('.', 1)[1].lower()
-    return extension in ALLOWED_EXTENSIONS.get(conversion_type, set())
+    dot = filename.rfind('.')
+    return dot != -1 and (conversion_type, filename[dot + 1:].lower()) in ALLOWED_PAIRS
+
+def mpeg_frame_sync(head):
+    """Whether head starts with the 11-bit MPEG audio frame sync"""
+    # Version, layer and CRC bits vary (0xFFFB, 0xFFFA, 0xFFE3, ...)
+    return len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0
+
+def validate_magic(head, extension):
+    """Check that a file header matches the signature of its extension"""
+    signatures = MAGIC_SIGNATURES.get(extension)
+    if signatures is None:
+        return True
+    if extension == 'mp3' and mpeg_frame_sync(head):
+        return True
+    return any(
+        all(head.startswith(magic, offset) for offset, magic in checks)
+        for checks in signatures
+    )
+
+def has_valid_header(file):
+    """Peek at the start of an upload and validate it against its extension"""
+    stream = file.stream
+    stream.seek(0)
+    head = stream.read(MAGIC_HEADER_SIZE)
+    stream.seek(0)
+    dot = file.filename.rfind('.')
+    return validate_magic(head, file.filename[dot + 1:].lower())
+
+def save_uploads(files):
+    """Return on-disk paths for several uploads in order plus a hash of their combined content"""
+    # create_temp_dir runs before the form is parsed, so StreamRequest has
+    # already written and hashed every upload into the temp directory
+    paths = [file.stream.name for file in files]
+    digests = [file.stream.digest.digest() for file in files]
+    
+    if len(digests) == 1:
+        return paths, digests[0].hex()
+    return paths, hashlib.blake2b(b''.join(digests), digest_size=16).hexdigest()
+
+def cache_lookup(cache_key):
+    """Return the cached output for a cache key, or None"""
+    entry_dir = os.path.join(app.config['CACHE_FOLDER'], cache_key)
+    try:
+        names = os.listdir(entry_dir)
+    except FileNotFoundError:
+        return None
+    if not names:
+        return None
+    
+    cache_path = os.path.join(entry_dir, names[0])
+    # Mark as recently used; atime alone is unreliable on noatime/relatime mounts
+    try:
+        os.utime(cache_path)
+    except OSError:
+        # Evicted since it was listed
+        return None
+    logging.info("Serving cached conversion: %s", cache_key)
+    return cache_path
+
+def cache_store(cache_key, input_path, output_path):
+    """Hard link a finished conversion into the cache, returning its cached path or None"""
+    # Keep only what the output name adds to the input name, so a hit can be
+    # renamed after whichever upload requested it
+    name = os.path.basename(output_path)
+    suffix = os.path.splitext(name)[1]
+    if isinstance(input_path, str):
+        base_name = os.path.splitext(os.path.basename(input_path))[0]
+        if name.startswith(base_name):
+            suffix = name[len(base_name):]
+    
+    entry_dir = os.path.join(app.config['CACHE_FOLDER'], cache_key)
+    cache_path = os.path.join(entry_dir, CACHE_ENTRY_NAME + suffix)
+    try:
+        os.makedirs(entry_dir, exist_ok=True)
+        try:
+            os.link(output_path, cache_path)
+        except FileExistsError:
+            raise
+        except OSError:
+            # Temp directories on tmpfs (or filesystems without hard links)
+            # need a real copy, published with a rename so a concurrent
+            # lookup never sees a partial file
+            staging_path = os.path.join(app.config['CACHE_FOLDER'], f".{cache_key}.{os.getpid()}.{threading.get_ident()}")
+            try:
+                shutil.copy2(output_path, staging_path)
+                os.replace(staging_path, cache_path)
+            finally:
+                if os.path.exists(staging_path):
+                    os.remove(staging_path)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        logging.warning("Failed to cache conversion output: %s", e)
+        return None
+    
+    evict_cache()
+    return cache_path
+
+def cached_download_name(cache_path, base_name):
+    """Download name for a cached output requested by an upload called base_name"""
+    return base_name + os.path.basename(cache_path)[len(CACHE_ENTRY_NAME):]
+
+def evict_cache():
+    """Remove least recently used cache entries once the cache grows past its size limit"""
+    global _last_cache_eviction
+    now = time.time()
+    if now - _last_cache_eviction < CACHE_EVICTION_INTERVAL:
+        return
+    _last_cache_eviction = now
+    
+    cache_folder = app.config['CACHE_FOLDER']
+    entries = []
+    total_size = 0
+    for cache_key in os.listdir(cache_folder):
+        entry_dir = os.path.join(cache_folder, cache_key)
+        try:
+            for name in os.listdir(entry_dir):
+                stat = os.stat(os.path.join(entry_dir, name))
+                entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, entry_dir))
+                total_size += stat.st_size
+        except OSError:
+            continue
+    
+    entries.sort()
+    for last_used, size, entry_dir in entries:
+        if total_size <= app.config['CACHE_MAX_BYTES']:
+            break
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        total_size -= size
+
+@app.before_request
+def create_temp_dir():
+    """Create the temporary directory uploads for this conversion are streamed into"""
+    if request.endpoint == 'convert_file':
+        g.temp_dir = tempfile.mkdtemp()
+
+@app.after_request
+def remove_temp_dir_after_response(response):
+    """Clean up the conversion's temporary directory in the background"""
+    temp_dir = g.pop('temp_dir', None)
+    if temp_dir:
+        # Deleting intermediate files can take a while (e.g. PDF page renders),
+        # so do it off the worker thread. send_file has already opened the
+        # output, so it keeps streaming after its directory entry is gone.
+        threading.Thread(
+            target=shutil.rmtree, args=(temp_dir,), kwargs={'ignore_errors': True}, daemon=True
+        ).start()
+    return response
+
+@app.teardown_request
+def remove_temp_dir(exc):
+    """Clean up the temporary directory of a request that failed before sending a response"""
+    temp_dir = g.pop('temp_dir', None)
+    if temp_dir:
+        try:
+            shutil.rmtree(temp_dir)
+        except Exception as e:
+            logging.warning("Failed to clean up temp directory: %s", e)
 
 @app.route('/')
 def index():
     """Home page with file upload form"""
-    return render_template('index.html')
+    return render_template('index.html', async_jobs=celery is not None)
 
 @app.route('/convert', methods=['POST'])
 def convert_file():
@@ -159,7 +460,7 @@ def convert_file():
             flash('No file selected', 'error')
             return redirect(url_for('index'))
         
-        if not conversion_type or conversion_type not in converters:
+        if not conversion_type or conversion_type not in CONVERTER_CLASSES:
             flash('Invalid conversion type selected', 'error')
             return redirect(url_for('index'))
         
@@ -167,56 +468,19 @@ def convert_file():
             flash(f'Invalid file type for {conversion_type.replace("_", " ").title()} conversion', 'error')
             return redirect(url_for('index'))
         
-        # Create temporary directories for this conversion
-        temp_dir = tempfile.mkdtemp()
-        
-        try:
-            # Save uploaded file
-            filename = secure_filename(file.filename)
-            input_path = os.path.join(temp_dir, filename)
-            file.save(input_path)
-            
-            # Get converter and perform conversion
-            converter = converters[conversion_type]
-            output_path = converter.convert(input_path, temp_dir)
-            
-            if not output_path or not os.path.exists(output_path):
-                flash('Conversion failed. Please try again.', 'error')
-                return redirect(url_for('index'))
-            
-            # Send file to user
-            download_name = os.path.basename(output_path)
-            
-            # Special handling for PDF to PNG (ZIP file)
-            if conversion_type == 'pdf_to_png' and output_path.endswith('.zip'):
-                base_name = os.path.splitext(os.path.basename(input_path))[0]
-                download_name = f"{base_name}_all_pages.zip"
-            
-            return send_file(
-                output_path,
-                as_attachment=True,
-                download_name=download_name,
-                mimetype=converter.output_mimetype
-            )
-            
-        except Exception as e:
-            logging.error(f"Conversion error: {str(e)}")
-            flash(f'Conversion failed: {str(e)}', 'error')
+        # Reject mislabelled files before spawning a converter on them
+        if not has_valid_header(file):
+            flash(f'File content does not match its extension: {file.filename}', 'error')
             return redirect(url_for('index'))
         
-        finally:
-            # Clean up temporary directory
-            try:
-                shutil.rmtree(temp_dir)
-            except Exception as e:
-                logging.warning(f"Failed to clean up temp directory: {str(e)}")
+        return run_conversion_request(conversion_type, [file], 'Conversion')
     
     except RequestEntityTooLarge:
         flash('File too large. Maximum size is 50MB.', 'error')
         return redirect(url_for('index'))
     
     except Exception as e:
-        logging.error(f"Unexpected error: {str(e)}")
+        logging.error("Unexpected error: %s", e)
         flash('An unexpected error occurred. Please try again.', 'error')
         return redirect(url_for('index'))
 
@@ -238,54 +502,22 @@ def handle_pdf_merge():
             if not file.filename.lower().endswith('.pdf'):
                 flash(f'All files must be PDF format. Invalid file: {file.filename}', 'error')
                 return redirect(url_for('index'))
+            if not has_valid_header(file):
+                flash(f'File content does not match its extension: {file.filename}', 'error')
+                return redirect(url_for('index'))
             pdf_files.append(file)
         
         if len(pdf_files) < 2:
             flash('Please select at least 2 valid PDF files to merge', 'error')
             return redirect(url_for('index'))
         
-        # Create temporary directory
-        temp_dir = tempfile.mkdtemp()
-        
-        try:
-            # Save all uploaded PDFs
-            input_paths = []
-            for i, file in enumerate(pdf_files):
-                filename = secure_filename(f"input_{i+1:02d}_{file.filename}")
-                input_path = os.path.join(temp_dir, filename)
-                file.save(input_path)
-                input_paths.append(input_path)
-            
-            # Perform PDF merge
-            converter = MergePDFsConverter()
-            output_path = converter.convert(input_paths, temp_dir)
-            
-            if not output_path or not os.path.exists(output_path):
-                flash('PDF merge failed. Please try again.', 'error')
-                return redirect(url_for('index'))
-            
-            # Send merged PDF to user
-            return send_file(
-                output_path,
-                as_attachment=True,
-                download_name=f"merged_{len(pdf_files)}_pdfs.pdf",
-                mimetype='application/pdf'
-            )
-            
-        except Exception as e:
-            logging.error(f"PDF merge error: {str(e)}")
-            flash(f'PDF merge failed: {str(e)}', 'error')
-            return redirect(url_for('index'))
-        
-        finally:
-            # Clean up temporary directory
-            try:
-                shutil.rmtree(temp_dir)
-            except Exception as e:
-                logging.warning(f"Failed to clean up temp directory: {str(e)}")
+        return run_conversion_request(
+            'merge_pdfs', pdf_files, 'PDF merge',
+            download_name=f"merged_{len(pdf_files)}_pdfs.pdf"
+        )
     
     except Exception as e:
-        logging.error(f"Unexpected error in PDF merge: {str(e)}")
+        logging.error("Unexpected error in PDF merge: %s", e)
         flash('An unexpected error occurred during PDF merge. Please try again.', 'error')
         return redirect(url_for('index'))
 
@@ -301,67 +533,196 @@ def handle_image_merge():
         
         # Validate all files are images
         image_files = []
-        allowed_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.bmp'}
-        
         for file in uploaded_files:
             if file.filename == '':
                 continue
-            
-            file_ext = os.path.splitext(file.filename.lower())[1]
-            if file_ext not in allowed_extensions:
+            if not allowed_file(file.filename, 'merge_images'):
                 flash(f'Invalid file type: {file.filename}. Only JPG, PNG, WEBP, BMP images are supported.', 'error')
                 return redirect(url_for('index'))
+            if not has_valid_header(file):
+                flash(f'File content does not match its extension: {file.filename}', 'error')
+                return redirect(url_for('index'))
             image_files.append(file)
         
         if len(image_files) < 2:
             flash('Please select at least 2 valid image files to merge', 'error')
             return redirect(url_for('index'))
         
-        # Create temporary directory
-        temp_dir = tempfile.mkdtemp()
+        return run_conversion_request(
+            'merge_images', image_files, 'Image merge',
+            download_name=f"merged_{len(image_files)}_images.pdf"
+        )
+    
+    except Exception as e:
+        logging.error("Unexpected error in image merge: %s", e)
+        flash('An unexpected error occurred during image merge. Please try again.', 'error')
+        return redirect(url_for('index'))
+
+class DecompressedFile:
+    """
+    Decoded view of a gzip file for send_file. It has no fileno(), so the
+    WSGI server streams what read() returns instead of sendfile()ing the
+    compressed file underneath, as gunicorn would with a GzipFile
+    """
+    
+    def __init__(self, path):
+        self._file = gzip.open(path, 'rb')
+    
+    def read(self, size=-1):
+        return self._file.read(size)
+    
+    def close(self):
+        self._file.close()
+
+def send_output(output_path, download_name, content_encoding=None, etag=True, **kwargs):
+    """
+    send_file for a conversion output. Outputs stored gzip-encoded (named
+    e.g. .html.gz) go out as-is with Content-Encoding to clients that
+    accept gzip and are decompressed for the rest
+    """
+    # Entries cached before their converter compressed its output are plain
+    if content_encoding != 'gzip' or not output_path.endswith('.gz'):
+        return send_file(output_path, download_name=download_name, etag=etag, **kwargs)
+    
+    # Either way the client ends up with the decoded file
+    if download_name.endswith('.gz'):
+        download_name = download_name[:-len('.gz')]
+    
+    if request.accept_encodings['gzip']:
+        # Each representation needs its own validator
+        if isinstance(etag, str):
+            etag = f"{etag}-gzip"
+        response = send_file(output_path, download_name=download_name, etag=etag, **kwargs)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = send_file(
+            DecompressedFile(output_path), download_name=download_name,
+            etag=etag if isinstance(etag, str) else False, **kwargs
+        )
+    response.vary.add('Accept-Encoding')
+    return response
+
+def run_conversion_request(conversion_type, files, label, download_name=None):
+    """Save validated uploads, convert them (or reuse a cached result) and send the output"""
+    temp_dir = g.temp_dir
+    
+    try:
+        # Uploads were streamed to disk while the form was parsed
+        input_paths, content_hash = save_uploads(files)
+        inputs = input_paths if len(input_paths) > 1 else input_paths[0]
+        base_name = os.path.splitext(os.path.basename(input_paths[0]))[0]
+        cache_key = f"{conversion_type}_{content_hash}"
+        converter = get_converter(conversion_type)
         
-        try:
-            # Save all uploaded images
-            input_paths = []
-            for i, file in enumerate(image_files):
-                filename = secure_filename(f"image_{i+1:02d}_{file.filename}")
-                input_path = os.path.join(temp_dir, filename)
-                file.save(input_path)
-                input_paths.append(input_path)
+        # PDF to PNG returns a ZIP of every page
+        if conversion_type == 'pdf_to_png':
+            download_name = f"{base_name}_all_pages.zip"
+        
+        # Serve a previous conversion of identical content straight from the cache
+        output_path = cache_lookup(cache_key)
+        cached = output_path is not None
+        if cached:
+            download_name = download_name or cached_download_name(output_path, base_name)
+            # Async clients expect JSON, so point them at the cached copy
+            if celery is not None:
+                return jsonify(download_url=url_for(
+                    'download_cached', cache_key=cache_key, name=download_name
+                ))
+        else:
+            # Hand off to the task queue when one is configured
+            if celery is not None:
+                task = run_conversion.delay(conversion_type, inputs, temp_dir, download_name, cache_key)
+                g.pop('temp_dir')  # The worker owns the directory now
+                return jsonify(job_id=task.id), 202
             
-            # Perform image merge
-            converter = MergeImagesConverter()
-            output_path = converter.convert(input_paths, temp_dir)
+            # Perform conversion
+            output_path = converter.convert(inputs, temp_dir)
             
             if not output_path or not os.path.exists(output_path):
-                flash('Image merge failed. Please try again.', 'error')
+                flash(f'{label} failed. Please try again.', 'error')
                 return redirect(url_for('index'))
             
-            # Send merged PDF to user
-            return send_file(
-                output_path,
-                as_attachment=True,
-                download_name=f"merged_{len(image_files)}_images.pdf",
-                mimetype='application/pdf'
+            cached = cache_store(cache_key, inputs, output_path) is not None
+            download_name = download_name or os.path.basename(output_path)
+        
+        # Send file to user, tagged with the content hash so the cacheable
+        # /download copy can be revalidated with If-None-Match
+        response = send_output(
+            output_path,
+            download_name,
+            content_encoding=converter.content_encoding,
+            as_attachment=True,
+            conditional=True,
+            etag=cache_key,
+            mimetype=converter.output_mimetype
+        )
+        if cached:
+            response.headers['Content-Location'] = url_for(
+                'download_cached', cache_key=cache_key, name=download_name
             )
-            
-        except Exception as e:
-            logging.error(f"Image merge error: {str(e)}")
-            flash(f'Image merge failed: {str(e)}', 'error')
-            return redirect(url_for('index'))
+        return response
         
-        finally:
-            # Clean up temporary directory
-            try:
-                shutil.rmtree(temp_dir)
-            except Exception as e:
-                logging.warning(f"Failed to clean up temp directory: {str(e)}")
-    
     except Exception as e:
-        logging.error(f"Unexpected error in image merge: {str(e)}")
-        flash('An unexpected error occurred during image merge. Please try again.', 'error')
+        logging.error("%s error: %s", label, e)
+        flash(f'{label} failed: {str(e)}', 'error')
         return redirect(url_for('index'))
 
+@app.route('/download/<cache_key>')
+def download_cached(cache_key):
+    """Send a cached conversion; the content never changes for a given key"""
+    if not CACHE_KEY_PATTERN.fullmatch(cache_key):
+        return jsonify(error='Not found'), 404
+    
+    output_path = cache_lookup(cache_key)
+    if not output_path:
+        return jsonify(error='Not found'), 404
+    
+    conversion_type = cache_key.rsplit('_', 1)[0]
+    download_name = safe_filename(request.args.get('name', ''))
+    response = send_output(
+        output_path,
+        download_name or cached_download_name(output_path, conversion_type),
+        content_encoding=get_converter(conversion_type).content_encoding,
+        as_attachment=True,
+        conditional=True,
+        etag=cache_key,
+        max_age=CACHE_MAX_AGE
+    )
+    response.cache_control.immutable = True
+    return response
+
+@app.route('/result/<job_id>')
+def conversion_result(job_id):
+    """Poll a queued conversion and send the file once it has finished"""
+    if celery is None:
+        return jsonify(error='Background conversions are not enabled'), 404
+    
+    result = celery.AsyncResult(job_id)
+    if not result.ready():
+        return jsonify(job_id=job_id, status=result.state), 202
+    
+    try:
+        job = result.get(timeout=0)
+    except Exception as e:
+        logging.error("Queued conversion failed: %s", e)
+        return jsonify(job_id=job_id, status='FAILURE', error=f'Conversion failed: {str(e)}'), 500
+    finally:
+        result.forget()
+    
+    # Removed with the request's own temp directory once the file has been sent
+    g.temp_dir = job['temp_dir']
+    
+    response = send_output(
+        job['output_path'],
+        job['download_name'],
+        content_encoding=job.get('content_encoding'),
+        as_attachment=True,
+        conditional=True,
+        etag=True,
+        mimetype=job['mimetype']
+    )
+    return response
+
 @app.errorhandler(413)
 def too_large(e):
     flash('File too large. Maximum size is 50MB.', 'error')
@@ -373,4 +734,5 @@ def internal_error(e):
     return redirect(url_for('index'))
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Development server only; production runs under gunicorn (see wsgi.py)
+    app.run(host='0.0.0.0', port=5000)
@@ -0,0 +1,23 @@
+# Gunicorn configuration, used with: gunicorn wsgi:app
+import os
+import multiprocessing
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '10000')}"
+
+# Import the app once in the master and fork workers from it, so the
+# loaded modules are shared copy-on-write instead of per worker
+preload_app = True
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+# Read by converters.py to split its per-process pools and limits between
+# the workers rather than giving each worker the whole machine
+os.environ['WEB_CONCURRENCY'] = str(workers)
+
+# gthread workers serve several conversions at once while each waits on
+# ffmpeg/libreoffice, and hand send_file responses to wsgi.file_wrapper
+# so downloads are written with sendfile(2) straight from the page cache
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+sendfile = True
+
+# Long video conversions run for minutes; don't let the arbiter kill them
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 300))
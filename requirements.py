@@ -51,6 +51,9 @@ def main():
         # Audio/Video processing
         "ffmpeg-python>=0.2.0",
         
+        # Background task queue (used when REDIS_URL is set)
+        "celery[redis]>=5.3.0",
+        
         # Email validation
         "email-validator>=2.1.0",
     ]
@@ -72,7 +75,7 @@ def main():
         print("\nNext steps:")
         print("1. Ensure system dependencies are installed (wkhtmltopdf, ffmpeg)")
         print("2. Set up environment variables if needed")
-        print("3. Run: python main.py or gunicorn main:app")
+        print("3. Run: python main.py or gunicorn wsgi:app")
     else:
         print("⚠ Some packages failed to install. Check the output above.")
         return 1
@@ -47,6 +47,7 @@ setup(
         "openpyxl>=3.1.2",
         "pandas>=2.1.4",
         "ffmpeg-python>=0.2.0",
+        "celery[redis]>=5.3.0",
         "email-validator>=2.1.0",
     ],
     entry_points={
@@ -257,8 +257,75 @@ document.addEventListener('DOMContentLoaded', function() {
         
         // Scroll to progress section
         progressSection.scrollIntoView({ behavior: 'smooth', block: 'center' });
+
+        // Queued conversions return a job id that we poll until the file is ready
+        if (form.dataset.async === 'true') {
+            e.preventDefault();
+            submitAsync();
+        }
     });
 
+    function submitAsync() {
+        fetch(form.action, {
+            method: 'POST',
+            body: new FormData(form),
+            headers: { 'Accept': 'application/json' },
+            redirect: 'manual'
+        })
+        .then(response => {
+            // Validation errors redirect back with a flash message
+            if (response.type === 'opaqueredirect') {
+                window.location.reload();
+                return;
+            }
+            // A cache hit comes back with a download URL instead of a job
+            return response.json().then(data => data.download_url
+                ? fetch(data.download_url).then(saveDownload)
+                : pollResult(data.job_id));
+        })
+        .catch(() => finishAsync('Conversion failed. Please try again.'));
+    }
+
+    function pollResult(jobId) {
+        fetch(`/result/${jobId}`)
+        .then(response => {
+            if (response.status === 202) {
+                setTimeout(() => pollResult(jobId), 2000);
+                return;
+            }
+
+            return saveDownload(response);
+        })
+        .catch(() => finishAsync('Conversion failed. Please try again.'));
+    }
+
+    function saveDownload(response) {
+        if (!response.ok) {
+            return response.json().then(data => finishAsync(data.error));
+        }
+
+        const disposition = response.headers.get('Content-Disposition') || '';
+        const match = disposition.match(/filename="?([^";]+)"?/);
+        return response.blob().then(blob => {
+            const link = document.createElement('a');
+            link.href = URL.createObjectURL(blob);
+            link.download = match ? match[1] : 'converted';
+            document.body.appendChild(link);
+            link.click();
+            link.remove();
+            URL.revokeObjectURL(link.href);
+            finishAsync();
+        });
+    }
+
+    function finishAsync(error) {
+        progressSection.style.display = 'none';
+        validateForm();
+        if (error) {
+            showAlert(error, 'error');
+        }
+    }
+
     // Utility function to format file size
     function formatFileSize(bytes) {
         if (bytes === 0) return '0 Bytes';
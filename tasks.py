@@ -0,0 +1,63 @@
+"""
+Celery task queue for running conversions outside the web worker.
+
+Enabled by setting REDIS_URL. Start one worker pool per queue, e.g.:
+    celery -A tasks worker -Q video_queue     # FFmpeg-heavy node
+    celery -A tasks worker -Q document_queue  # LibreOffice/PDF node
+Workers must share the filesystem used for uploads with the web process.
+"""
+import os
+import shutil
+import logging
+from celery import Celery
+
+celery = Celery(
+    'converter',
+    broker=os.environ['REDIS_URL'],
+    backend=os.environ.get('CELERY_RESULT_BACKEND', os.environ['REDIS_URL'])
+)
+
+# Conversions handled by FFmpeg; everything else goes to the document pool
+VIDEO_CONVERSIONS = {
+    'mp4_to_mp3', 'mp3_to_wav', 'wav_to_mp3', 'ogg_to_mp3',
+    'mp4_to_avi', 'avi_to_mp4', 'mkv_to_mp4', 'mp4_to_webm'
+}
+
+def route_conversion(name, args, kwargs, options, task=None, **kw):
+    """Route each conversion to the worker pool suited to its workload"""
+    if name != 'converter.run_conversion':
+        return None
+    conversion_type = args[0] if args else kwargs.get('conversion_type')
+    if conversion_type in VIDEO_CONVERSIONS:
+        return {'queue': 'video_queue'}
+    return {'queue': 'document_queue'}
+
+celery.conf.task_routes = (route_conversion,)
+
+@celery.task(name='converter.run_conversion')
+def run_conversion(conversion_type, input_path, temp_dir, download_name=None, cache_key=None):
+    """Run a conversion and return what the web process needs to send the result"""
+    from app import get_converter, cache_store
+
+    try:
+        converter = get_converter(conversion_type)
+        output_path = converter.convert(input_path, temp_dir)
+
+        if not output_path or not os.path.exists(output_path):
+            raise Exception("Converted file was not created")
+
+        if cache_key:
+            cache_store(cache_key, input_path, output_path)
+
+        return {
+            'output_path': output_path,
+            'download_name': download_name or os.path.basename(output_path),
+            'mimetype': converter.output_mimetype,
+            'content_encoding': converter.content_encoding,
+            'temp_dir': temp_dir
+        }
+
+    except Exception as e:
+        logging.error("Queued conversion error: %s", e)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
@@ -0,0 +1,19 @@
+import converters
+
+
+def test_html_document_text_with_xml_declaration():
+    html = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml"><body><p>Fish &amp; chips</p></body></html>'
+    )
+    assert converters.html_document_text(html).strip() == 'Fish & chips'
+
+
+def test_html_document_text_empty_after_declaration():
+    assert converters.html_document_text('<?xml version="1.0"?>  ') == ''
+
+
+def test_csv_column_widths_cover_rows_past_the_first_chunk():
+    rows = [['1', 'short']] * converters.CSV_PDF_CHUNK_ROWS + [['2', 'x' * 60]]
+    widths = converters.csv_column_widths(['id', 'name'], rows)
+    assert widths[1] >= converters.stringWidth('x' * 60, 'Helvetica', 10)
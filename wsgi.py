@@ -0,0 +1,2 @@
+# WSGI entry point for gunicorn: gunicorn wsgi:app
+from app import app